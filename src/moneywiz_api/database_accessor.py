@@ -1,16 +1,16 @@
 import sqlite3
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Any, Callable, Tuple
-from decimal import Decimal
+from typing import Dict, List, Any, Callable, Optional, Tuple
 
 from moneywiz_api.model.record import Record
 from moneywiz_api.model.raw_data_handler import RawDataHandler as RDH
-from moneywiz_api.types import ENT_ID, ID, GID
+from moneywiz_api.types import Amount, ENT_ID, ID, GID
 
 
 class DatabaseAccessor:
     def __init__(self, db_path: Path):
+        self.db_path = db_path
         self._con = sqlite3.connect(db_path, uri=True)
 
         def dict_factory(cursor, row):
@@ -49,16 +49,39 @@ class DatabaseAccessor:
     def ent_for(self, typename: str) -> ENT_ID:
         return self._typename_to_ent.get(typename)
 
-    def query_objects(self, typenames: List[str]) -> List[Any]:
+    def query_objects(
+        self, typenames: List[str], pk_range: Optional[Tuple[ID, ID]] = None
+    ) -> List[Any]:
+        """
+        :param typenames:
+        :param pk_range: inclusive (first, last) Z_PK bounds, all rows when None
+        :return:
+        """
+        placeholders = ",".join("?" * len(typenames))
+        query = f"SELECT * FROM ZSYNCOBJECT WHERE Z_ENT in ({placeholders})"
+        params = [self.ent_for(x) for x in typenames]
+        if pk_range is not None:
+            query += " AND Z_PK BETWEEN ? AND ?"
+            params.extend(pk_range)
+
         cur = self._con.cursor()
+        # Fetch plain tuples and zip them with the column names resolved once,
+        # rather than walking cursor.description for every row.
+        cur.row_factory = None
+        res = cur.execute(query, params)
+        columns = [col[0] for col in res.description]
+        return [dict(zip(columns, row)) for row in res]
+
+    def query_ids(self, typenames: List[str]) -> List[ID]:
+        placeholders = ",".join("?" * len(typenames))
+        cur = self._con.cursor()
+        cur.row_factory = None
         res = cur.execute(
-            """
-        SELECT * FROM ZSYNCOBJECT WHERE Z_ENT in (%s)
-        """
-            % (",".join("?" * len(typenames))),
+            f"SELECT Z_PK FROM ZSYNCOBJECT WHERE Z_ENT in ({placeholders})"
+            " ORDER BY Z_PK",
             [self.ent_for(x) for x in typenames],
         )
-        return res.fetchall()
+        return [row[0] for row in res]
 
     def get_record(self, pk_id: ID, constructor: Callable = Record):
         cur = self._con.cursor()
@@ -84,8 +107,8 @@ class DatabaseAccessor:
 
         return constructor(res.fetchone())
 
-    def get_category_assignment(self) -> Dict[ID, List[Tuple[ID, Decimal]]]:
-        transaction_map: Dict[ID, List[Tuple[ID, Decimal]]] = defaultdict(list)
+    def get_category_assignment(self) -> Dict[ID, List[Tuple[ID, Amount]]]:
+        transaction_map: Dict[ID, List[Tuple[ID, Amount]]] = defaultdict(list)
         cur = self._con.cursor()
         res = cur.execute(
             """
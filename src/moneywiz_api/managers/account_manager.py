@@ -36,6 +36,6 @@ class AccountManager(RecordManager[Account]):
 
     def get_accounts_for_user(self, user_id: ID) -> List[Account]:
         return sorted(
-            [x for _, x in self.records().items() if x.user == user_id],
+            [x for x in super().records().values() if x.user == user_id],
             key=lambda x: (x.group_id, x.display_order),
         )
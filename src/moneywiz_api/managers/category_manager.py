@@ -32,6 +32,6 @@ class CategoryManager(RecordManager[Category]):
 
     def get_categories_for_user(self, user_id: ID) -> List[Category]:
         return sorted(
-            [x for _, x in self.records().items() if x.user == user_id],
+            [x for x in self.records().values() if x.user == user_id],
             key=lambda x: x.type,
         )
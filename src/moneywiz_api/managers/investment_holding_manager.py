@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import Dict, Callable, List
 from decimal import Decimal
 
@@ -9,6 +10,7 @@ from moneywiz_api.types import ID
 class InvestmentHoldingManager(RecordManager[InvestmentHolding]):
     def __init__(self):
         super().__init__()
+        self._account_to_records: Dict[ID, List[InvestmentHolding]] = defaultdict(list)
 
     @property
     def ents(self) -> Dict[str, Callable]:
@@ -16,8 +18,12 @@ class InvestmentHoldingManager(RecordManager[InvestmentHolding]):
             "InvestmentHolding": InvestmentHolding,
         }
 
+    def add(self, record: InvestmentHolding) -> None:
+        super().add(record)
+        self._account_to_records[record.account].append(record)
+
     def get_holdings_for_account(self, account_id: ID) -> List[InvestmentHolding]:
-        return [x for _, x in self.records().items() if x.account == account_id]
+        return list(self._account_to_records.get(account_id, []))
 
     def update_last_price(self, latest_price: Decimal):
         raise NotImplementedError()
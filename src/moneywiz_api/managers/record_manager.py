@@ -1,13 +1,39 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, TypeVar, Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Generic, List, Optional, Tuple, TypeVar, Callable
 
 from moneywiz_api.database_accessor import DatabaseAccessor
+from moneywiz_api.model.raw_data_handler import RawDataHandler as RDH
 from moneywiz_api.model.record import Record
-from moneywiz_api.types import ID, GID
+from moneywiz_api.types import ENT_ID, ID, GID
 
 
 T = TypeVar("T", bound=Record)
 
+# Each worker process opens its own connection to the database
+_worker_accessor: Optional[DatabaseAccessor] = None
+
+
+def _init_worker(db_path: Path, use_float: bool) -> None:
+    global _worker_accessor  # pylint: disable=global-statement
+    _worker_accessor = DatabaseAccessor(db_path)
+    # Spawned workers do not inherit module state set at runtime
+    RDH.use_float = use_float
+
+
+def _construct_range(ents: Dict[str, Callable], pk_range: Tuple[ID, ID]) -> List[Any]:
+    assert _worker_accessor is not None
+    constructors: Dict[ENT_ID, Callable] = {
+        _worker_accessor.ent_for(typename): constructor
+        for typename, constructor in ents.items()
+    }
+    return [
+        constructors[record["Z_ENT"]](record)
+        for record in _worker_accessor.query_objects(list(ents), pk_range)
+    ]
+
 
 class RecordManager(ABC, Generic[T]):
     def __init__(self):
@@ -19,14 +45,53 @@ class RecordManager(ABC, Generic[T]):
     def ents(self) -> Dict[str, Callable]:
         raise NotImplementedError()
 
-    def load(self, db_accessor: DatabaseAccessor) -> None:
-        records = db_accessor.query_objects(self.ents.keys())
+    def load(self, db_accessor: DatabaseAccessor, workers: int = 1) -> None:
+        """
+        Loads all records of this manager's types.
 
+        :param db_accessor:
+        :param workers: number of processes to load records with, records are
+            loaded in the calling process when 1. Each worker reads and builds
+            the records of a Z_PK range, only the built records are sent back.
+            Only worth it for large tables.
+        :return:
+        """
+        if workers > 1:
+            self._load_parallel(db_accessor, workers)
+            return
+
+        ents = self.ents
+        records = db_accessor.query_objects(ents.keys())
+        constructors: Dict[ENT_ID, Callable] = {
+            db_accessor.ent_for(typename): constructor
+            for typename, constructor in ents.items()
+        }
+
+        add = self.add
         for record in records:
-            typename = db_accessor.typename_for(record["Z_ENT"])
-            if typename in self.ents:
-                obj = self.ents[typename](record)
-                self.add(obj)
+            constructor = constructors.get(record["Z_ENT"])
+            if constructor is not None:
+                add(constructor(record))
+
+    def _load_parallel(self, db_accessor: DatabaseAccessor, workers: int) -> None:
+        ents = self.ents
+        ids = db_accessor.query_ids(list(ents))
+        # A few ranges per worker keeps them busy when ranges differ in cost
+        chunk_size = max(1, -(-len(ids) // (workers * 4)))
+        pk_ranges = [
+            (ids[i], ids[min(i + chunk_size, len(ids)) - 1])
+            for i in range(0, len(ids), chunk_size)
+        ]
+
+        add = self.add
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(db_accessor.db_path, RDH.use_float),
+        ) as executor:
+            for records in executor.map(partial(_construct_range, ents), pk_ranges):
+                for record in records:
+                    add(record)
 
     def add(self, record: T) -> None:
         self._records[record.id] = record
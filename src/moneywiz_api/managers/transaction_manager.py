@@ -1,6 +1,6 @@
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, Callable, List, Tuple
-from decimal import Decimal
 
 from moneywiz_api.database_accessor import DatabaseAccessor
 from moneywiz_api.model.transaction import (
@@ -17,15 +17,33 @@ from moneywiz_api.model.transaction import (
     WithdrawTransaction,
 )
 from moneywiz_api.managers.record_manager import RecordManager
-from moneywiz_api.types import ID
+from moneywiz_api.types import Amount, ID
+from moneywiz_api.utils import get_date
+
+
+def _until_filter(until: datetime) -> Callable[[Transaction], bool]:
+    """
+    Matches transactions dated at or before until, on the raw dates.
+    Transaction.datetime rounds to microseconds, so a date less than a
+    microsecond after until may still match, those are checked on datetime.
+    """
+    until_date = get_date(until)
+
+    def is_until(transaction: Transaction) -> bool:
+        return transaction.date <= until_date or (
+            transaction.date - until_date < 1e-6 and transaction.datetime <= until
+        )
+
+    return is_until
 
 
 class TransactionManager(RecordManager[Transaction]):
     def __init__(self):
         super().__init__()
-        self.category_assignment: Dict[ID, List[Tuple[ID, Decimal]]] = {}
+        self.category_assignment: Dict[ID, List[Tuple[ID, Amount]]] = {}
         self.refund_maps: Dict[ID, ID] = {}
         self.tags_map: Dict[ID, ID] = {}
+        self._account_to_records: Dict[ID, List[Transaction]] = defaultdict(list)
 
     @property
     def ents(self) -> Dict[str, Callable]:
@@ -42,17 +60,22 @@ class TransactionManager(RecordManager[Transaction]):
             "WithdrawTransaction": WithdrawTransaction,
         }
 
-    def load(self, db_accessor: DatabaseAccessor) -> None:
-        super().load(db_accessor)
-        self.category_assignment: Dict[ID, List[Tuple[ID, Decimal]]] = (
+    def load(self, db_accessor: DatabaseAccessor, workers: int = 1) -> None:
+        super().load(db_accessor, workers)
+        self.category_assignment: Dict[ID, List[Tuple[ID, Amount]]] = (
             db_accessor.get_category_assignment()
         )
         self.refund_maps: Dict[ID, ID] = db_accessor.get_refund_maps()
         self.tags_map: Dict[ID, ID] = db_accessor.get_tags_map()
 
+    def add(self, record: Transaction) -> None:
+        super().add(record)
+        if not isinstance(record, TransferBudgetTransaction):
+            self._account_to_records[record.account].append(record)
+
     def category_for_transaction(
         self, transaction_id: ID
-    ) -> List[Tuple[ID, Decimal]] | None:
+    ) -> List[Tuple[ID, Amount]] | None:
         return self.category_assignment.get(transaction_id)
 
     def tags_for_transaction(self, transaction_id: ID) -> List[ID] | None:
@@ -72,23 +95,19 @@ class TransactionManager(RecordManager[Transaction]):
         :param until: inclusive
         :return:
         """
+        is_until = _until_filter(until)
         return sorted(
-            [
-                x
-                for _, x in self.records().items()
-                if not isinstance(x, TransferBudgetTransaction)
-                and x.account == account_id
-                and x.datetime <= until
-            ],
-            key=lambda x: x.datetime,
+            [x for x in self._account_to_records.get(account_id, []) if is_until(x)],
+            key=lambda x: x.date,
         )
 
     def get_all(self, until: datetime = datetime.now()) -> List[Transaction]:
+        is_until = _until_filter(until)
         return sorted(
             [
                 x
-                for _, x in self.records().items()
-                if not isinstance(x, TransferBudgetTransaction) and x.datetime <= until
+                for x in self.records().values()
+                if not isinstance(x, TransferBudgetTransaction) and is_until(x)
             ],
-            key=lambda x: x.datetime,
+            key=lambda x: x.date,
         )
@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
 from moneywiz_api.model.record import Record
 from moneywiz_api.types import CategoryType, ID
 
+_CATEGORY_TYPES: Dict[int, CategoryType] = {1: "Expenses", 2: "Income"}
+
 
 @dataclass
 class Category(Record):
@@ -32,6 +34,9 @@ class Category(Record):
 
     @staticmethod
     def _convert_type(type_: Optional[int]) -> CategoryType:
-        if type_ and type_ in [1, 2]:
-            return "Expenses" if type_ == 1 else "Income"
-        raise RuntimeError(f"Invalid type {type_}")
+        if type_ is None:
+            raise RuntimeError(f"Invalid type {type_}")
+        category_type = _CATEGORY_TYPES.get(type_)
+        if category_type is None:
+            raise RuntimeError(f"Invalid type {type_}")
+        return category_type
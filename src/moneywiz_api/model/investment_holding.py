@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import ClassVar, Optional, Tuple
 from decimal import Decimal
 
 from moneywiz_api.model.raw_data_handler import RawDataHandler as RDH
@@ -7,7 +7,7 @@ from moneywiz_api.model.record import Record
 from moneywiz_api.types import ID
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentHolding(Record):
     """
     ENT: 24
@@ -41,19 +41,24 @@ class InvestmentHolding(Record):
     """
     _cost_basis_of_missing_ob_shares: Decimal = field(repr=False)
 
+    _AS_DICT_EXCLUDED: ClassVar[Tuple[str, ...]] = Record._AS_DICT_EXCLUDED + (
+        "_investment_object_type",
+        "_cost_basis_of_missing_ob_shares",
+    )
+
     def __init__(self, row):
-        super().__init__(row)
+        super(InvestmentHolding, self).__init__(row)
         self.account = row["ZINVESTMENTACCOUNT"]
         self.opening_number_of_shares = RDH.get_nullable_decimal(
             row, "ZOPENNINGNUMBEROFSHARES"
         )
         self.number_of_shares = RDH.get_decimal(row, "ZNUMBEROFSHARES")
         # self.price_per_share = row["ZPRICEPERSHARE"]
-        self.symbol = row["ZSYMBOL"]
-        self.holding_type = row["ZHOLDINGTYPE"]
+        self.symbol = RDH.get_interned_str(row, "ZSYMBOL")
+        self.holding_type = RDH.get_interned_str(row, "ZHOLDINGTYPE")
         self.description = row["ZDESC"]
-        self.price_per_share_available_online = (
-            row["ZISPRICEPERSHAREAVAILABLEONLINE"] == 1
+        self.price_per_share_available_online = bool(
+            row["ZISPRICEPERSHAREAVAILABLEONLINE"]
         )
 
         self._investment_object_type = row["ZINVESTMENTOBJECTTYPE"]
@@ -64,7 +69,8 @@ class InvestmentHolding(Record):
         # Fixes
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None, self.as_dict()
@@ -75,9 +81,3 @@ class InvestmentHolding(Record):
 
         assert self._investment_object_type is not None, self.as_dict()
         assert self._cost_basis_of_missing_ob_shares is not None, self.as_dict()
-
-    def as_dict(self) -> Dict[str, Any]:
-        original = super().as_dict()
-        del original["_investment_object_type"]
-        del original["_cost_basis_of_missing_ob_shares"]
-        return original
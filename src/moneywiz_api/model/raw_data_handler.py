@@ -1,49 +1,86 @@
+from functools import lru_cache
+from sys import intern
 from typing import Optional, Dict, Any
 from datetime import datetime
 from decimal import Decimal
 
-from moneywiz_api.utils import get_datetime
+from moneywiz_api import utils
+from moneywiz_api.types import Amount
+
+# Amounts, rates and dates repeat a lot across rows, so conversions are cached
+# on the raw value.
+_to_datetime = lru_cache(maxsize=4096)(utils.get_datetime)
+
+
+@lru_cache(maxsize=4096)
+def _to_decimal(raw_value: str) -> Decimal:
+    return Decimal(raw_value)
+
+
+# The converters are module-level functions so that hot callers can import and
+# call them directly, without the RawDataHandler attribute lookup.
+
+
+def get_datetime(row: Dict[str, Any], key: str) -> datetime:
+    raw_value = row[key]
+    assert isinstance(raw_value, float) or isinstance(
+        raw_value, int
+    ), f"row['{key}'] = {row[key]}, is not a float or int, where row is: " + str(
+        filter_row(row)
+    )
+    return _to_datetime(raw_value)
+
+
+def get_nullable_decimal(row: Dict[str, Any], key: str) -> Optional[Amount]:
+    raw_value = row[key]
+    if raw_value is None:
+        return None
+    else:
+        return get_decimal(row, key)
+
+
+def get_decimal(row: Dict[str, Any], key: str) -> Amount:
+    raw_value = row[key]
+    assert isinstance(raw_value, float) or isinstance(
+        raw_value, int
+    ), f"row['{key}'] = {row[key]}, is not a float or int, where row is: " + str(
+        filter_row(row)
+    )
+    if RawDataHandler.use_float:
+        return float(raw_value)
+    return _to_decimal(str(raw_value))
+
+
+def get_interned_str(row: Dict[str, Any], key: str) -> Optional[str]:
+    """
+    Currency codes and symbols repeat across rows, interning keeps a single
+    copy of each value. None is passed through.
+    """
+    raw_value = row[key]
+    if raw_value is None:
+        return None
+    return intern(raw_value)
+
+
+def filter_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    copy = {k: v for k, v in row.items()}
+    del copy["ZMANUALHISTORICALPRICESPERSHARE"]
+    del copy["ZIMPORTLINKIDARRAY2"]
+    del copy["ZIMPORTLINKIDARRAY"]
+    del copy["ZBANKLOGOPRIMARYCOLOR"]
+    return {
+        k: v for k, v in copy.items() if (v is not None) and (not k.startswith("Z9_"))
+    }
 
 
 class RawDataHandler:
+    # When True, amounts are loaded as float instead of Decimal. Loading and
+    # arithmetic get much cheaper, at the cost of binary rounding errors.
+    # Set it before loading the database.
+    use_float: bool = False
 
-    @staticmethod
-    def get_datetime(row: Dict[str, Any], key: str) -> datetime:
-        raw_value = row[key]
-        assert isinstance(raw_value, float) or isinstance(
-            raw_value, int
-        ), f"row['{key}'] = {row[key]}, is not a float or int, where row is: " + str(
-            RawDataHandler.filter_row(row)
-        )
-        return get_datetime(raw_value)
-
-    @staticmethod
-    def get_nullable_decimal(row: Dict[str, Any], key: str) -> Optional[Decimal]:
-        raw_value = row[key]
-        if raw_value is None:
-            return None
-        else:
-            return RawDataHandler.get_decimal(row, key)
-
-    @staticmethod
-    def get_decimal(row: Dict[str, Any], key: str) -> Decimal:
-        raw_value = row[key]
-        assert isinstance(raw_value, float) or isinstance(
-            raw_value, int
-        ), f"row['{key}'] = {row[key]}, is not a float or int, where row is: " + str(
-            RawDataHandler.filter_row(row)
-        )
-        return Decimal(str(raw_value))
-
-    @staticmethod
-    def filter_row(row: Dict[str, Any]) -> Dict[str, Any]:
-        copy = {k: v for k, v in row.items()}
-        del copy["ZMANUALHISTORICALPRICESPERSHARE"]
-        del copy["ZIMPORTLINKIDARRAY2"]
-        del copy["ZIMPORTLINKIDARRAY"]
-        del copy["ZBANKLOGOPRIMARYCOLOR"]
-        return {
-            k: v
-            for k, v in copy.items()
-            if (v is not None) and (not k.startswith("Z9_"))
-        }
+    get_datetime = staticmethod(get_datetime)
+    get_nullable_decimal = staticmethod(get_nullable_decimal)
+    get_decimal = staticmethod(get_decimal)
+    get_interned_str = staticmethod(get_interned_str)
+    filter_row = staticmethod(filter_row)
@@ -1,12 +1,14 @@
-from dataclasses import dataclass, asdict, field
-from typing import Dict, Any
+from dataclasses import dataclass, field, fields
+from typing import ClassVar, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from moneywiz_api.types import ID, ENT_ID
 from moneywiz_api.model.raw_data_handler import RawDataHandler as RDH
 
 
-@dataclass
+# Subclasses declared with ``slots=True`` must call ``super(Cls, self)``
+# explicitly, zero-argument ``super()`` breaks on the re-created slotted class.
+@dataclass(slots=True)
 class Record:
     _raw: Dict[str, Any] = field(repr=False)
     _ent: ENT_ID = field(repr=False)
@@ -14,6 +16,13 @@ class Record:
     gid: str = field(repr=False)
     id: ID
 
+    # Fields left out of as_dict()
+    _AS_DICT_EXCLUDED: ClassVar[Tuple[str, ...]] = ("_raw", "_ent", "_created_at")
+    # Fields exported by as_dict() under another attribute, e.g. a property
+    _AS_DICT_ALIASES: ClassVar[Dict[str, str]] = {}
+    # Names exported by as_dict(), computed once per class
+    _as_dict_names: ClassVar[Optional[Tuple[str, ...]]] = None
+
     def __init__(self, row):
         self._raw = row
         self._ent = row["Z_ENT"]
@@ -59,8 +68,17 @@ class Record:
 
         :return:
         """
-        original = asdict(self)
-        del original["_raw"]
-        del original["_ent"]
-        del original["_created_at"]
-        return original
+        return {name: getattr(self, name) for name in self._as_dict_fields()}
+
+    @classmethod
+    def _as_dict_fields(cls) -> Tuple[str, ...]:
+        # Looked up in the class itself, a subclass must not reuse its parent's
+        names = vars(cls).get("_as_dict_names")
+        if names is None:
+            names = tuple(
+                cls._AS_DICT_ALIASES.get(f.name, f.name)
+                for f in fields(cls)
+                if f.name not in cls._AS_DICT_EXCLUDED
+            )
+            cls._as_dict_names = names
+        return names
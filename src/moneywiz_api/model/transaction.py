@@ -2,20 +2,53 @@ from abc import ABC
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Callable, ClassVar, Dict, Optional, Tuple
 
-import pytest
-
-from moneywiz_api.model.raw_data_handler import RawDataHandler as RDH
+from moneywiz_api.model.raw_data_handler import (
+    get_decimal,
+    get_interned_str,
+    get_nullable_decimal,
+)
 from moneywiz_api.model.record import Record
 from moneywiz_api.types import ID
-
+from moneywiz_api.utils import get_datetime
 
 TOLERANCE = 1e-8
 TOLERANCE_AMOUNT = 0.01
 
+_DEC_ZERO = Decimal(0)
+
+# (attribute, column, converter), a converter of None copies the raw value
+FieldSpec = Tuple[str, str, Optional[Callable[[Dict[str, Any], str], Any]]]
+
 
-@dataclass
+def _compile_populate(cls) -> Callable[[Any, Dict[str, Any]], None]:
+    """
+    Generates a function assigning every _FIELDS entry along the MRO of cls,
+    with one plain assignment per field, so it runs as fast as hand-written
+    assignments in __init__.
+
+    Columns are read with row[...] on purpose: dict subscripts are a
+    specialised bytecode, pre-binding row.__getitem__ or row.get is slower.
+    """
+    namespace: Dict[str, Any] = {}
+    body = []
+    for klass in reversed(cls.__mro__):
+        for name, column, converter in vars(klass).get("_FIELDS", ()):
+            if converter is None:
+                body.append(f"    self.{name} = row[{column!r}]")
+            else:
+                namespace[f"_convert_{name}"] = converter
+                body.append(f"    self.{name} = _convert_{name}(row, {column!r})")
+
+    source = "\n".join(["def _populate(self, row):", *(body or ["    pass"])])
+    exec(source, namespace)  # pylint: disable=exec-used
+    populate = namespace["_populate"]
+    populate.__qualname__ = f"{cls.__qualname__}._populate"
+    return populate
+
+
+@dataclass(slots=True)
 class Transaction(Record, ABC):
     """
     ENT: 36
@@ -25,16 +58,27 @@ class Transaction(Record, ABC):
 
     amount: Decimal
     description: str
-    datetime: datetime
+    date: float  # seconds since 2001-01-01, see the datetime property
     notes: Optional[str]
 
+    _AS_DICT_ALIASES: ClassVar[Dict[str, str]] = {"date": "datetime"}
+
+    # Columns read by each subclass, assigned by _populate() before the
+    # subclass __init__ applies its fixes
+    _FIELDS: ClassVar[Tuple[FieldSpec, ...]] = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super(Transaction, cls).__init_subclass__(**kwargs)
+        cls._populate = _compile_populate(cls)
+
     def __init__(self, row):
-        super().__init__(row)
-        self.reconciled = row["ZRECONCILED"] == 1
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
+        super(Transaction, self).__init__(row)
+        self.reconciled = bool(row["ZRECONCILED"])
+        self.amount = get_decimal(row, "ZAMOUNT1")
         self.description = row["ZDESC2"]
-        self.datetime = RDH.get_datetime(row, "ZDATE1")
+        self.date = row["ZDATE1"]
         self.notes = row["ZNOTES1"]
+        self._populate(row)
 
         # Fixes
 
@@ -42,11 +86,28 @@ class Transaction(Record, ABC):
         assert self.reconciled is not None, self.as_dict()
         assert self.amount is not None, self.as_dict()
         assert self.description is not None, self.as_dict()
-        assert self.datetime is not None, self.as_dict()
+        assert isinstance(self.date, (float, int)), self.as_dict()
         # self.notes can be None
 
+    def _populate(self, row):
+        pass
+
+    @property
+    def datetime(self) -> datetime:
+        """
+        Built on access, compare and sort by date where possible.
+        """
+        return get_datetime(self.date)
 
-@dataclass
+    @property
+    def amount_decimal(self) -> Decimal:
+        """
+        Exact amount, also when RawDataHandler.use_float is enabled.
+        """
+        return Decimal(str(self.amount))
+
+
+@dataclass(slots=True)
 class DepositTransaction(Transaction):
     """
     ENT: 37
@@ -61,23 +122,24 @@ class DepositTransaction(Transaction):
     original_amount: Decimal  # neg: expense, pos: income
     original_exchange_rate: Optional[Decimal]
 
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("payee", "ZPAYEE2", None),
+        ("original_currency", "ZORIGINALCURRENCY", get_interned_str),
+        ("original_amount", "ZORIGINALAMOUNT", get_decimal),
+        ("original_exchange_rate", "ZORIGINALEXCHANGERATE", get_nullable_decimal),
+    )
+
     def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-        self.payee = row["ZPAYEE2"]
-        self.original_currency = row["ZORIGINALCURRENCY"]
-        self.original_amount = RDH.get_decimal(row, "ZORIGINALAMOUNT")
-        self.original_exchange_rate = RDH.get_nullable_decimal(
-            row, "ZORIGINALEXCHANGERATE"
-        )
+        super(DepositTransaction, self).__init__(row)
 
         # Fixes
-        if self.original_exchange_rate == Decimal(0):
+        if self.original_exchange_rate == _DEC_ZERO:
             self.original_exchange_rate = None
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None, self.as_dict()
@@ -89,11 +151,12 @@ class DepositTransaction(Transaction):
         assert self.amount * self.original_amount > 0, self.as_dict()  # Same sign
         if self.original_exchange_rate is not None:
             assert (
-                self.amount == pytest.approx(self.original_amount * self.original_exchange_rate, abs=TOLERANCE_AMOUNT)
+                abs(self.amount - self.original_amount * self.original_exchange_rate)
+                <= TOLERANCE_AMOUNT
             ), self.as_dict()
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentExchangeTransaction(Transaction):
     """
     ENT: 38
@@ -113,23 +176,23 @@ class InvestmentExchangeTransaction(Transaction):
     to_number_of_shares: Decimal
     to_symbol: str
 
-    def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-
-        self.from_investment_holding = row["ZFROMINVESTMENTHOLDING"]
-        self.from_number_of_shares = RDH.get_decimal(row, "ZFROMNUMBEROFSHARES")
-        self.from_symbol = row["ZFROMSYMBOL"]
-
-        self.original_fee = RDH.get_decimal(row, "ZORIGINALFEE")
-        self.original_fee_currency = row["ZORIGINALFEECURRENCY"]
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("from_investment_holding", "ZFROMINVESTMENTHOLDING", None),
+        ("from_number_of_shares", "ZFROMNUMBEROFSHARES", get_decimal),
+        ("from_symbol", "ZFROMSYMBOL", get_interned_str),
+        ("original_fee", "ZORIGINALFEE", get_decimal),
+        ("original_fee_currency", "ZORIGINALFEECURRENCY", get_interned_str),
+        ("to_investment_holding", "ZTOINVESTMENTHOLDING", None),
+        ("to_number_of_shares", "ZTONUMBEROFSHARES", get_decimal),
+        ("to_symbol", "ZTOSYMBOL", get_interned_str),
+    )
 
-        self.to_investment_holding = row["ZTOINVESTMENTHOLDING"]
-        self.to_number_of_shares = RDH.get_decimal(row, "ZTONUMBEROFSHARES")
-        self.to_symbol = row["ZTOSYMBOL"]
+    def __init__(self, row):
+        super(InvestmentExchangeTransaction, self).__init__(row)
 
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -146,17 +209,18 @@ class InvestmentExchangeTransaction(Transaction):
         assert self.to_number_of_shares is not None
         assert self.to_symbol is not None
 
-@dataclass
+
+@dataclass(slots=True)
 class InvestmentTransaction(Transaction, ABC):
     """
     ENT: 39
     """
 
     def __init__(self, row):
-        super().__init__(row)
+        super(InvestmentTransaction, self).__init__(row)
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentBuyTransaction(InvestmentTransaction):
     """
     ENT: 40
@@ -171,22 +235,24 @@ class InvestmentBuyTransaction(InvestmentTransaction):
     number_of_shares: Decimal
     price_per_share: Decimal
 
-    def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("fee", "ZFEE2", get_decimal),
+        ("investment_holding", "ZINVESTMENTHOLDING", None),
+        ("number_of_shares", "ZNUMBEROFSHARES1", get_decimal),
+        ("price_per_share", "ZPRICEPERSHARE1", get_decimal),
+    )
 
-        self.fee = RDH.get_decimal(row, "ZFEE2")
-
-        self.investment_holding = row["ZINVESTMENTHOLDING"]
-        self.number_of_shares = RDH.get_decimal(row, "ZNUMBEROFSHARES1")
-        self.price_per_share = RDH.get_decimal(row, "ZPRICEPERSHARE1")
+    def __init__(self, row):
+        super(InvestmentBuyTransaction, self).__init__(row)
 
         # Fixes
-        self.fee = max(self.fee, 0)
+        if self.fee < 0:
+            self.fee = 0
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -195,18 +261,21 @@ class InvestmentBuyTransaction(InvestmentTransaction):
         assert self.fee is not None
         assert self.fee >= 0
         # Either tiny (close to 0) or positive
-        assert abs(self.fee) == pytest.approx(0, abs=TOLERANCE) or self.fee > TOLERANCE
+        assert abs(self.fee) <= TOLERANCE or self.fee > TOLERANCE
         assert self.investment_holding is not None
         assert self.number_of_shares is not None
         assert self.number_of_shares > 0
         assert self.price_per_share is not None
         assert self.price_per_share >= 0
-        assert -(
-            self.number_of_shares * self.price_per_share + self.fee
-        ) == pytest.approx(self.amount, abs=TOLERANCE_AMOUNT)
+        assert (
+            abs(
+                -(self.number_of_shares * self.price_per_share + self.fee) - self.amount
+            )
+            <= TOLERANCE_AMOUNT
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class InvestmentSellTransaction(InvestmentTransaction):
     """
     ENT: 41
@@ -221,22 +290,24 @@ class InvestmentSellTransaction(InvestmentTransaction):
     number_of_shares: Decimal
     price_per_share: Decimal
 
-    def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-
-        self.fee = RDH.get_decimal(row, "ZFEE2")
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("fee", "ZFEE2", get_decimal),
+        ("investment_holding", "ZINVESTMENTHOLDING", None),
+        ("number_of_shares", "ZNUMBEROFSHARES1", get_decimal),
+        ("price_per_share", "ZPRICEPERSHARE1", get_decimal),
+    )
 
-        self.investment_holding = row["ZINVESTMENTHOLDING"]
-        self.number_of_shares = RDH.get_decimal(row, "ZNUMBEROFSHARES1")
-        self.price_per_share = RDH.get_decimal(row, "ZPRICEPERSHARE1")
+    def __init__(self, row):
+        super(InvestmentSellTransaction, self).__init__(row)
 
         # Fixes
-        self.fee = max(self.fee, 0)
+        if self.fee < 0:
+            self.fee = 0
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -245,7 +316,7 @@ class InvestmentSellTransaction(InvestmentTransaction):
         assert self.fee is not None
         assert self.fee >= 0
         # Either tiny (close to 0) or positive
-        assert abs(self.fee) == pytest.approx(0, abs=TOLERANCE) or self.fee > TOLERANCE
+        assert abs(self.fee) <= TOLERANCE or self.fee > TOLERANCE
 
         assert self.investment_holding is not None
         assert self.number_of_shares is not None
@@ -253,11 +324,12 @@ class InvestmentSellTransaction(InvestmentTransaction):
         assert self.price_per_share is not None
         assert self.price_per_share >= 0
         assert (
-            self.number_of_shares * self.price_per_share - self.fee
-        ) == pytest.approx(self.amount, abs=TOLERANCE_AMOUNT)
+            abs(self.number_of_shares * self.price_per_share - self.fee - self.amount)
+            <= TOLERANCE_AMOUNT
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class ReconcileTransaction(Transaction):
     """
     ENT: 42
@@ -267,14 +339,17 @@ class ReconcileTransaction(Transaction):
     amount: Decimal  # neg: expense, pos: income
     reconcile_amount: Decimal  # new balance
 
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("reconcile_amount", "ZRECONCILEAMOUNT", get_nullable_decimal),
+    )
+
     def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-        self.reconcile_amount = RDH.get_nullable_decimal(row, "ZRECONCILEAMOUNT")
+        super(ReconcileTransaction, self).__init__(row)
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -282,7 +357,7 @@ class ReconcileTransaction(Transaction):
         # assert self.reconcile_amount is not None
 
 
-@dataclass
+@dataclass(slots=True)
 class RefundTransaction(Transaction):
     """
     ENT: 43
@@ -297,24 +372,24 @@ class RefundTransaction(Transaction):
     original_amount: Decimal
     original_exchange_rate: Optional[Decimal]
 
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("payee", "ZPAYEE2", None),
+        ("original_currency", "ZORIGINALCURRENCY", get_interned_str),
+        ("original_amount", "ZORIGINALAMOUNT", get_decimal),
+        ("original_exchange_rate", "ZORIGINALEXCHANGERATE", get_nullable_decimal),
+    )
+
     def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-        self.payee = row["ZPAYEE2"]
-
-        self.original_currency = row["ZORIGINALCURRENCY"]
-        self.original_amount = RDH.get_decimal(row, "ZORIGINALAMOUNT")
-        self.original_exchange_rate = RDH.get_nullable_decimal(
-            row, "ZORIGINALEXCHANGERATE"
-        )
+        super(RefundTransaction, self).__init__(row)
 
         # Fixes
-        if self.original_exchange_rate == Decimal(0):
+        if self.original_exchange_rate == _DEC_ZERO:
             self.original_exchange_rate = None
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -326,23 +401,24 @@ class RefundTransaction(Transaction):
         assert self.original_amount > 0
 
         if self.original_exchange_rate is not None:
-            assert self.amount == pytest.approx(
-                self.original_amount * self.original_exchange_rate, abs=TOLERANCE_AMOUNT
+            assert (
+                abs(self.amount - self.original_amount * self.original_exchange_rate)
+                <= TOLERANCE_AMOUNT
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferBudgetTransaction(Transaction):
     """
     ENT: 44
     """
 
     def __init__(self, row):
-        super().__init__(row)
+        super(TransferBudgetTransaction, self).__init__(row)
         # TODO: Not Implemented
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferDepositTransaction(Transaction):
     """
     ENT: 45
@@ -365,29 +441,29 @@ class TransferDepositTransaction(Transaction):
 
     original_exchange_rate: Decimal
 
-    def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-
-        self.sender_account = row["ZSENDERACCOUNT"]
-        self.sender_transaction = row["ZSENDERTRANSACTION"]
-
-        self.original_amount = RDH.get_decimal(row, "ZORIGINALAMOUNT")
-        self.original_currency = row["ZORIGINALCURRENCY"]
-        self.sender_amount = RDH.get_decimal(row, "ZORIGINALSENDERAMOUNT")
-        self.sender_currency = row["ZORIGINALSENDERCURRENCY"]
-
-        self.original_fee = RDH.get_nullable_decimal(row, "ZORIGINALFEE")
-        self.original_fee_currency = row["ZORIGINALFEECURRENCY"]
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("sender_account", "ZSENDERACCOUNT", None),
+        ("sender_transaction", "ZSENDERTRANSACTION", None),
+        ("original_amount", "ZORIGINALAMOUNT", get_decimal),
+        ("original_currency", "ZORIGINALCURRENCY", get_interned_str),
+        ("sender_amount", "ZORIGINALSENDERAMOUNT", get_decimal),
+        ("sender_currency", "ZORIGINALSENDERCURRENCY", get_interned_str),
+        ("original_fee", "ZORIGINALFEE", get_nullable_decimal),
+        ("original_fee_currency", "ZORIGINALFEECURRENCY", get_interned_str),
+        ("original_exchange_rate", "ZORIGINALEXCHANGERATE", get_decimal),
+    )
 
-        self.original_exchange_rate = RDH.get_decimal(row, "ZORIGINALEXCHANGERATE")
+    def __init__(self, row):
+        super(TransferDepositTransaction, self).__init__(row)
 
         # Fixes
-        self.original_amount = abs(self.original_amount)
+        if self.original_amount < 0:
+            self.original_amount = -self.original_amount
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -409,13 +485,13 @@ class TransferDepositTransaction(Transaction):
 
         # assert self.amount ==  self.original_amount # original_amount could be different with amount ZCURRENCYEXCHANGERATE is playing up
 
-        assert self.original_amount == pytest.approx(
-            -self.sender_amount * self.original_exchange_rate,
-            abs=TOLERANCE,
+        assert (
+            abs(self.original_amount + self.sender_amount * self.original_exchange_rate)
+            <= TOLERANCE
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TransferWithdrawTransaction(Transaction):
     """
     ENT: 46
@@ -438,25 +514,24 @@ class TransferWithdrawTransaction(Transaction):
 
     original_exchange_rate: Decimal
 
-    def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-
-        self.recipient_account = row["ZRECIPIENTACCOUNT1"]
-        self.recipient_transaction = row["ZRECIPIENTTRANSACTION"]
-
-        self.original_amount = RDH.get_decimal(row, "ZORIGINALAMOUNT")
-        self.original_currency = row["ZORIGINALCURRENCY"]
-        self.recipient_amount = RDH.get_nullable_decimal(row, "ZORIGINALRECIPIENTAMOUNT")
-        self.recipient_currency = row["ZORIGINALRECIPIENTCURRENCY"]
-
-        self.original_fee = RDH.get_nullable_decimal(row, "ZORIGINALFEE")
-        self.original_fee_currency = row["ZORIGINALFEECURRENCY"]
+    number_of_shares: Optional[Decimal]
+
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("recipient_account", "ZRECIPIENTACCOUNT1", None),
+        ("recipient_transaction", "ZRECIPIENTTRANSACTION", None),
+        ("original_amount", "ZORIGINALAMOUNT", get_decimal),
+        ("original_currency", "ZORIGINALCURRENCY", get_interned_str),
+        ("recipient_amount", "ZORIGINALRECIPIENTAMOUNT", get_nullable_decimal),
+        ("recipient_currency", "ZORIGINALRECIPIENTCURRENCY", get_interned_str),
+        ("original_fee", "ZORIGINALFEE", get_nullable_decimal),
+        ("original_fee_currency", "ZORIGINALFEECURRENCY", get_interned_str),
+        ("original_exchange_rate", "ZORIGINALEXCHANGERATE", get_decimal),
+        ("number_of_shares", "ZNUMBEROFSHARES1", get_nullable_decimal),
+    )
 
-        self.original_exchange_rate = RDH.get_decimal(row, "ZORIGINALEXCHANGERATE")
-
-        self.number_of_shares = RDH.get_nullable_decimal(row, 'ZNUMBEROFSHARES1')
+    def __init__(self, row):
+        super(TransferWithdrawTransaction, self).__init__(row)
 
         # Fixes
         if self.recipient_amount is None:
@@ -466,7 +541,8 @@ class TransferWithdrawTransaction(Transaction):
             self.recipient_currency = self.original_currency
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -487,16 +563,22 @@ class TransferWithdrawTransaction(Transaction):
         assert self.original_exchange_rate is not None
 
         # assert self.amount == self.original_amount
-        assert -self.original_amount == pytest.approx(
-            self.recipient_amount / self.original_exchange_rate,
-            abs=TOLERANCE,
+        assert (
+            abs(
+                -self.original_amount
+                - self.recipient_amount / self.original_exchange_rate
+            )
+            <= TOLERANCE
         )
 
         if self.number_of_shares is not None and self.number_of_shares > 0:
-            assert -self.number_of_shares == -self.original_amount + self.original_fee
+            assert (
+                abs(-self.number_of_shares + self.original_amount - self.original_fee)
+                <= TOLERANCE
+            )
 
 
-@dataclass
+@dataclass(slots=True)
 class WithdrawTransaction(Transaction):
     """
     ENT: 47
@@ -511,27 +593,27 @@ class WithdrawTransaction(Transaction):
     original_amount: Decimal  # neg: expense, pos: income ATTENTION: sign got fixed
     original_exchange_rate: Optional[Decimal]
 
+    _FIELDS = (
+        ("account", "ZACCOUNT2", None),
+        ("payee", "ZPAYEE2", None),
+        ("original_currency", "ZORIGINALCURRENCY", get_interned_str),
+        ("original_amount", "ZORIGINALAMOUNT", get_decimal),
+        ("original_exchange_rate", "ZORIGINALEXCHANGERATE", get_nullable_decimal),
+    )
+
     def __init__(self, row):
-        super().__init__(row)
-        self.account = row["ZACCOUNT2"]
-        self.amount = RDH.get_decimal(row, "ZAMOUNT1")
-        self.payee = row["ZPAYEE2"]
-
-        self.original_currency = row["ZORIGINALCURRENCY"]
-        self.original_amount = RDH.get_decimal(row, "ZORIGINALAMOUNT")
-        self.original_exchange_rate = RDH.get_nullable_decimal(
-            row, "ZORIGINALEXCHANGERATE"
-        )
+        super(WithdrawTransaction, self).__init__(row)
 
         # Fixes
         if self.amount * self.original_amount < 0:
             self.original_amount = -self.original_amount
 
-        if self.original_exchange_rate == Decimal(0):
+        if self.original_exchange_rate == _DEC_ZERO:
             self.original_exchange_rate = None
 
         # Validate
-        self.validate()
+        if __debug__:
+            self.validate()
 
     def validate(self):
         assert self.account is not None
@@ -543,6 +625,7 @@ class WithdrawTransaction(Transaction):
         assert self.amount * self.original_amount > 0
 
         if self.original_exchange_rate is not None:
-            assert self.amount == pytest.approx(
-                self.original_amount * self.original_exchange_rate, abs=TOLERANCE_AMOUNT
+            assert (
+                abs(self.amount - self.original_amount * self.original_exchange_rate)
+                <= TOLERANCE_AMOUNT
             )
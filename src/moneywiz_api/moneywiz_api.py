@@ -15,7 +15,12 @@ logger = logging.getLogger(__name__)
 
 
 class MoneywizApi:
-    def __init__(self, db_file: Path):
+    def __init__(self, db_file: Path, workers: int = 1):
+        """
+        :param db_file:
+        :param workers: number of processes used to load transactions,
+            see RecordManager.load
+        """
         self.accessor = DatabaseAccessor(db_file)
         self.account_manager = AccountManager()
         self.payee_manager = PayeeManager()
@@ -24,12 +29,12 @@ class MoneywizApi:
         self.investment_holding_manager = InvestmentHoldingManager()
         self.tag_manager = TagManager()
 
-        self.load()
+        self.load(workers)
 
-    def load(self):
+    def load(self, workers: int = 1):
         self.account_manager.load(self.accessor)
         self.payee_manager.load(self.accessor)
         self.category_manager.load(self.accessor)
-        self.transaction_manager.load(self.accessor)
+        self.transaction_manager.load(self.accessor, workers)
         self.investment_holding_manager.load(self.accessor)
         self.tag_manager.load(self.accessor)
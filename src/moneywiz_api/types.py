@@ -1,3 +1,4 @@
+from decimal import Decimal
 from typing import Literal
 
 ID = int
@@ -5,3 +6,6 @@ GID = str
 ENT_ID = int
 
 CategoryType = Literal["Expenses", "Income"]
+
+# Decimal, or float when RawDataHandler.use_float is set
+Amount = Decimal | float
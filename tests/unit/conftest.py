@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Any, Dict
 
 from moneywiz_api import MoneywizApi
 
@@ -17,3 +18,21 @@ payee_manager = moneywizApi.payee_manager
 category_manager = moneywizApi.category_manager
 transaction_manager = moneywizApi.transaction_manager
 investment_holding_manager = moneywizApi.investment_holding_manager
+
+
+def make_row(ent: int, **columns: Any) -> Dict[str, Any]:
+    row = {
+        "Z_PK": 1,
+        "Z_ENT": ent,
+        "ZGID": "gid",
+        "ZOBJECTCREATIONDATE": 700000000.0,
+        "ZRECONCILED": 0,
+        "ZDESC2": "description",
+        "ZDATE1": 700000000.0,
+        "ZNOTES1": None,
+        "ZACCOUNT2": 1,
+        "ZPAYEE2": None,
+        "ZORIGINALCURRENCY": "USD",
+    }
+    row.update(columns)
+    return row
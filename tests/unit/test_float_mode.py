@@ -0,0 +1,133 @@
+from decimal import Decimal
+from typing import Any, Dict
+
+import pytest
+
+from moneywiz_api.model.raw_data_handler import RawDataHandler
+from moneywiz_api.model.transaction import (
+    DepositTransaction,
+    InvestmentExchangeTransaction,
+    InvestmentBuyTransaction,
+    InvestmentSellTransaction,
+    ReconcileTransaction,
+    RefundTransaction,
+    TransferBudgetTransaction,
+    TransferDepositTransaction,
+    TransferWithdrawTransaction,
+    WithdrawTransaction,
+)
+
+from conftest import make_row
+
+# Amounts picked so that the float arithmetic in validate() is inexact,
+# e.g. 0.1 * 3.0 != 0.3
+ROWS = [
+    (
+        DepositTransaction,
+        make_row(37, ZAMOUNT1=0.3, ZORIGINALAMOUNT=0.1, ZORIGINALEXCHANGERATE=3.0),
+    ),
+    (
+        InvestmentExchangeTransaction,
+        make_row(
+            38,
+            ZAMOUNT1=0.0,
+            ZFROMINVESTMENTHOLDING=1,
+            ZFROMNUMBEROFSHARES=0.1,
+            ZFROMSYMBOL="BTC",
+            ZORIGINALFEE=0.0,
+            ZORIGINALFEECURRENCY="BTC",
+            ZTOINVESTMENTHOLDING=2,
+            ZTONUMBEROFSHARES=0.3,
+            ZTOSYMBOL="ETH",
+        ),
+    ),
+    (
+        InvestmentBuyTransaction,
+        make_row(
+            40,
+            ZAMOUNT1=-0.7,
+            ZFEE2=0.1,
+            ZINVESTMENTHOLDING=1,
+            ZNUMBEROFSHARES1=3.0,
+            ZPRICEPERSHARE1=0.2,
+        ),
+    ),
+    (
+        InvestmentSellTransaction,
+        make_row(
+            41,
+            ZAMOUNT1=0.5,
+            ZFEE2=0.1,
+            ZINVESTMENTHOLDING=1,
+            ZNUMBEROFSHARES1=3.0,
+            ZPRICEPERSHARE1=0.2,
+        ),
+    ),
+    (
+        ReconcileTransaction,
+        make_row(42, ZAMOUNT1=0.1, ZRECONCILEAMOUNT=0.3),
+    ),
+    (
+        RefundTransaction,
+        make_row(43, ZAMOUNT1=0.3, ZORIGINALAMOUNT=0.1, ZORIGINALEXCHANGERATE=3.0),
+    ),
+    (
+        TransferBudgetTransaction,
+        make_row(44, ZAMOUNT1=0.1),
+    ),
+    (
+        TransferDepositTransaction,
+        make_row(
+            45,
+            ZAMOUNT1=0.3,
+            ZSENDERACCOUNT=2,
+            ZSENDERTRANSACTION=2,
+            ZORIGINALAMOUNT=-0.3,
+            ZORIGINALSENDERAMOUNT=-0.1,
+            ZORIGINALSENDERCURRENCY="EUR",
+            ZORIGINALFEE=None,
+            ZORIGINALFEECURRENCY=None,
+            ZORIGINALEXCHANGERATE=3.0,
+        ),
+    ),
+    (
+        TransferWithdrawTransaction,
+        make_row(
+            46,
+            ZAMOUNT1=-0.1,
+            ZRECIPIENTACCOUNT1=2,
+            ZRECIPIENTTRANSACTION=2,
+            ZORIGINALAMOUNT=-0.1,
+            ZORIGINALRECIPIENTAMOUNT=None,
+            ZORIGINALRECIPIENTCURRENCY=None,
+            ZORIGINALFEE=-0.4,
+            ZORIGINALFEECURRENCY="USD",
+            ZORIGINALEXCHANGERATE=1.0,
+            ZNUMBEROFSHARES1=0.3,
+        ),
+    ),
+    (
+        WithdrawTransaction,
+        make_row(47, ZAMOUNT1=-0.3, ZORIGINALAMOUNT=0.1, ZORIGINALEXCHANGERATE=3.0),
+    ),
+]
+
+
+@pytest.fixture(params=[False, True], ids=["decimal", "float"])
+def use_float(request):
+    previous = RawDataHandler.use_float
+    RawDataHandler.use_float = request.param
+    yield request.param
+    RawDataHandler.use_float = previous
+
+
+@pytest.mark.parametrize(
+    "transaction_class,row", ROWS, ids=[cls.__name__ for cls, _ in ROWS]
+)
+def test_build_transaction(use_float: bool, transaction_class, row: Dict[str, Any]):
+    transaction = transaction_class(row)
+    if hasattr(transaction, "validate"):
+        transaction.validate()
+
+    assert isinstance(transaction.amount, float if use_float else Decimal)
+    assert transaction.amount_decimal == Decimal(str(row["ZAMOUNT1"]))
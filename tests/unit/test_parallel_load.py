@@ -0,0 +1,26 @@
+import pytest
+
+from moneywiz_api.managers.transaction_manager import TransactionManager
+
+from conftest import accessor, account_manager, transaction_manager
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_load_matches_serial(workers: int):
+    parallel_manager = TransactionManager()
+    parallel_manager.load(accessor, workers=workers)
+
+    serial_records = transaction_manager.records()
+    parallel_records = parallel_manager.records()
+    assert parallel_records.keys() == serial_records.keys()
+    for record_id, record in serial_records.items():
+        parallel_record = parallel_records[record_id]
+        assert type(parallel_record) is type(record)
+        assert parallel_record.as_dict() == record.as_dict()
+        assert parallel_record.filtered() == record.filtered()
+
+    # Records with the same date may be ordered differently
+    for account_id in account_manager.records():
+        assert sorted(
+            x.id for x in parallel_manager.get_all_for_account(account_id)
+        ) == sorted(x.id for x in transaction_manager.get_all_for_account(account_id))
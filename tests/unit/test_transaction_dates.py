@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+from typing import Iterable, List
+
+import pytest
+
+from moneywiz_api.managers.transaction_manager import TransactionManager
+from moneywiz_api.model.transaction import (
+    DepositTransaction,
+    Transaction,
+    TransferBudgetTransaction,
+)
+from moneywiz_api.types import ID
+from moneywiz_api.utils import get_datetime
+
+from conftest import (
+    account_manager,
+    transaction_manager,
+    make_row,
+    BALANCE_AS_OF_DATE,
+)
+
+
+def until_by_datetime(records: Iterable[Transaction], until: datetime) -> List[ID]:
+    # The filter get_all and get_all_for_account used to apply
+    return [
+        x.id
+        for x in sorted(records, key=lambda x: x.datetime)
+        if not isinstance(x, TransferBudgetTransaction) and x.datetime <= until
+    ]
+
+
+BOUNDARY_DATE = 700000000.0
+BOUNDARY = get_datetime(BOUNDARY_DATE)
+
+# Dates around the boundary, including ones less than a microsecond away that
+# Transaction.datetime rounds onto it
+DATES = [
+    BOUNDARY_DATE - 1,
+    BOUNDARY_DATE - 1e-6,
+    BOUNDARY_DATE - 1e-7,
+    BOUNDARY_DATE,
+    BOUNDARY_DATE + 1.2e-7,
+    BOUNDARY_DATE + 4e-7,
+    BOUNDARY_DATE + 6e-7,
+    BOUNDARY_DATE + 1e-6,
+    BOUNDARY_DATE + 2e-6,
+    BOUNDARY_DATE + 1,
+]
+
+
+@pytest.fixture(name="boundary_manager")
+def fixture_boundary_manager() -> TransactionManager:
+    manager = TransactionManager()
+    for pk, date in enumerate(DATES, start=1):
+        manager.add(
+            DepositTransaction(
+                make_row(
+                    37,
+                    Z_PK=pk,
+                    ZGID=f"gid{pk}",
+                    ZDATE1=date,
+                    ZAMOUNT1=1.0,
+                    ZORIGINALAMOUNT=1.0,
+                    ZORIGINALEXCHANGERATE=1.0,
+                )
+            )
+        )
+    return manager
+
+
+@pytest.mark.parametrize(
+    "until",
+    [
+        BOUNDARY - timedelta(seconds=1),
+        BOUNDARY - timedelta(microseconds=1),
+        BOUNDARY,
+        BOUNDARY + timedelta(microseconds=1),
+        BOUNDARY + timedelta(seconds=1),
+    ],
+)
+def test_until_boundary(boundary_manager: TransactionManager, until: datetime):
+    expected = until_by_datetime(boundary_manager.records().values(), until)
+
+    assert [x.id for x in boundary_manager.get_all(until)] == expected
+    assert [x.id for x in boundary_manager.get_all_for_account(1, until)] == expected
+
+
+@pytest.mark.parametrize("account_id", list(account_manager.records()))
+def test_until_matches_datetime_comparison(account_id: ID):
+    records = transaction_manager.get_all_for_account(account_id)
+    untils = [BALANCE_AS_OF_DATE] + [
+        x.datetime for x in records[:: max(1, len(records) // 5)]
+    ]
+
+    for until in untils:
+        # Records with the same date may be ordered differently
+        assert sorted(
+            x.id for x in transaction_manager.get_all_for_account(account_id, until)
+        ) == sorted(until_by_datetime(records, until))
+
+
+def test_get_all_matches_datetime_comparison():
+    records = transaction_manager.records().values()
+    assert sorted(x.id for x in transaction_manager.get_all(BALANCE_AS_OF_DATE)) == (
+        sorted(until_by_datetime(records, BALANCE_AS_OF_DATE))
+    )
+
+
+@pytest.mark.parametrize(
+    "transaction",
+    list(transaction_manager.records().values()),
+)
+def test_as_dict_datetime(transaction: Transaction):
+    as_dict = transaction.as_dict()
+
+    assert "date" not in as_dict
+    assert as_dict["datetime"] == get_datetime(transaction.filtered()["ZDATE1"])